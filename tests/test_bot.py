@@ -0,0 +1,45 @@
+import asyncio
+
+import pytest
+
+import vkquick
+import vkquick.bot
+
+
+class _PolicyRecordingBot(vkquick.Bot):
+    """Вместо получения событий запоминает политику цикла событий"""
+
+    used_policy = None
+
+    async def coroutine_run(self):
+        self.used_policy = asyncio.get_event_loop_policy()
+
+
+def _make_bot(**kwargs):
+    return _PolicyRecordingBot(api=vkquick.API("token"), **kwargs)
+
+
+def test_run_without_uvloop_keeps_policy():
+    policy = asyncio.get_event_loop_policy()
+    bot = _make_bot(use_uvloop=False)
+    bot.run()
+    assert bot.used_policy is policy
+    assert asyncio.get_event_loop_policy() is policy
+
+
+def test_run_falls_back_when_uvloop_is_missing(monkeypatch):
+    monkeypatch.setattr(vkquick.bot, "uvloop", None)
+    policy = asyncio.get_event_loop_policy()
+    bot = _make_bot()
+    bot.run()
+    assert bot.used_policy is policy
+    assert asyncio.get_event_loop_policy() is policy
+
+
+def test_run_restores_policy_after_uvloop():
+    uvloop = pytest.importorskip("uvloop")
+    policy = asyncio.get_event_loop_policy()
+    bot = _make_bot()
+    bot.run()
+    assert isinstance(bot.used_policy, uvloop.EventLoopPolicy)
+    assert asyncio.get_event_loop_policy() is policy
@@ -0,0 +1,38 @@
+import pytest
+
+import vkquick
+
+
+async def message_new(ehctx):
+    ...
+
+
+@pytest.mark.parametrize(
+    "handling_event_types",
+    [["message_new", "message_edit"], ("message_new",), {4}],
+)
+def test_handling_event_types_accepts_iterables(handling_event_types):
+    handler = vkquick.EventHandler(
+        message_new, handling_event_types=handling_event_types
+    )
+    for event_type in handling_event_types:
+        assert handler.is_handling_event_type(event_type)
+
+
+def test_handling_event_types_defaults_to_handler_name():
+    handler = vkquick.EventHandler(message_new)
+    assert handler.is_handling_event_type("message_new")
+    assert not handler.is_handling_event_type("message_edit")
+
+
+def test_handling_event_types_accepts_single_name():
+    handler = vkquick.EventHandler(
+        message_new, handling_event_types="message_edit"
+    )
+    assert handler.is_handling_event_type("message_edit")
+    assert not handler.is_handling_event_type("message")
+
+
+def test_handling_event_types_rejects_non_iterables():
+    with pytest.raises(TypeError):
+        vkquick.EventHandler(message_new, handling_event_types=4)
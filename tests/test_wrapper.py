@@ -0,0 +1,21 @@
+from vkquick.bases.wrapper import Wrapper
+
+
+class _ExtraFieldsWrapper(Wrapper):
+    def _extra_fields_to_format(self) -> dict:
+        return {"name": "extra", "b": {"k": "nested"}}
+
+
+def test_extra_fields_override_fields():
+    wrapper = _ExtraFieldsWrapper({"name": "field", "id": 1})
+    assert format(wrapper, "<name> <id>") == "extra 1"
+
+
+def test_nested_lookup():
+    wrapper = _ExtraFieldsWrapper({"id": 1})
+    assert format(wrapper, "<b[k]>") == "nested"
+
+
+def test_missing_key_left_as_placeholder():
+    wrapper = _ExtraFieldsWrapper({"id": 1})
+    assert format(wrapper, "<id> <missing>") == "1 {missing}"
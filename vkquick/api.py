@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import enum
+import functools
 import os
 import re
 import time
@@ -21,6 +22,12 @@ if ty.TYPE_CHECKING:
     from vkquick.bases.json_parser import JSONParser
 
 
+_METHOD_NAME_LETTER_REGEX = re.compile(r"_(?P<let>[a-z])")
+"""
+Буква после нижнего подчеркивания в snake_case имени метода
+"""
+
+
 class TokenOwnerType(enum.Enum):
     """Тип владельца токена: пользователь/группа/сервисный токен"""
 
@@ -270,10 +277,11 @@ class API(SessionContainerMixin):
         """
         # Конвертация параметров запроса под особенности API и имени метода
         real_method_name = _convert_method_name(method_name)
+        # Токен и версия добавляются прямо в уже новый словарь
+        # параметров, если не были перекрыты, без лишнего копирования
         real_request_params = _convert_params_for_api(request_params)
-        extra_request_params = self._stable_request_params.copy()
-        extra_request_params.update(real_request_params)
-        real_request_params = extra_request_params
+        for key, value in self._stable_request_params.items():
+            real_request_params.setdefault(key, value)
 
         # Определение владельца токена нужно
         # для определения задержки между запросами
@@ -448,6 +456,9 @@ def _upper_zero_group(__match: ty.Match) -> str:
     return __match.group("let").upper()
 
 
+# Набор вызываемых методов у бота обычно небольшой,
+# поэтому имена конвертируются только один раз
+@functools.lru_cache(maxsize=1024)
 def _convert_method_name(__name: str) -> str:
     """Конвертирует snake_case в camelCase.
 
@@ -468,4 +479,4 @@ def _convert_method_name(__name: str) -> str:
       : Новое имя метода в camelCase
 
     """
-    return re.sub(r"_(?P<let>[a-z])", _upper_zero_group, __name)
+    return _METHOD_NAME_LETTER_REGEX.sub(_upper_zero_group, __name)
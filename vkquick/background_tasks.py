@@ -0,0 +1,31 @@
+"""
+Запуск задач, выполнение которых не дожидаются
+"""
+import asyncio
+import typing as ty
+
+_running_tasks: ty.Set[asyncio.Task] = set()
+"""
+Задачи, которые еще не завершились. Цикл событий хранит
+на задачи только слабые ссылки, поэтому без этого множества
+сборщик мусора может уничтожить задачу во время ее выполнения
+"""
+
+
+def create_background_task(
+    coro: ty.Coroutine[ty.Any, ty.Any, ty.Any]
+) -> asyncio.Task:
+    """
+    Создает задачу, не дожидаясь ее выполнения. Ссылка на задачу
+    хранится до ее завершения
+
+    Args:
+        coro: Корутина, выполняемая в задаче
+
+    Returns:
+        Созданную задачу
+    """
+    task = asyncio.create_task(coro)
+    _running_tasks.add(task)
+    task.add_done_callback(_running_tasks.discard)
+    return task
@@ -7,6 +7,7 @@ import typing as ty
 import aiohttp
 from loguru import logger
 
+from vkquick.background_tasks import create_background_task
 from vkquick.bases.json_parser import JSONParser
 from vkquick.bases.session_container import SessionContainerMixin
 from vkquick.event import Event
@@ -109,12 +110,16 @@ class EventsFactory(abc.ABC):
         """ """
         asyncio.run(self.coroutine_run())
 
-    async def _run_through_callbacks(self, event: Event) -> None:
+    async def _run_through_callbacks(self, *events: Event) -> None:
         updates = [
             callback(event)
+            for event in events
             for callback in self._new_event_callbacks
         ]
-        await asyncio.gather(*updates)
+        if len(updates) == 1:
+            await updates[0]
+        else:
+            await asyncio.gather(*updates)
 
 
 class LongPollBase(SessionContainerMixin, EventsFactory):
@@ -151,6 +156,7 @@ class LongPollBase(SessionContainerMixin, EventsFactory):
     async def _listen(self) -> ty.AsyncGenerator[Event, None]:
         await self._setup()
         self._update_baked_request()
+        event_wrapper = self._event_wrapper
 
         while True:
             try:
@@ -161,9 +167,8 @@ class LongPollBase(SessionContainerMixin, EventsFactory):
             else:
                 async with response:
                     if "X-Next-Ts" in response.headers:
-                        self._requests_query_params.update(
-                            ts=response.headers["X-Next-Ts"]
-                        )
+                        next_ts = response.headers["X-Next-Ts"]
+                        self._requests_query_params["ts"] = next_ts
                         self._update_baked_request()
                         response = await self._parse_json_body(response)
                     else:
@@ -175,9 +180,15 @@ class LongPollBase(SessionContainerMixin, EventsFactory):
                 if not response["updates"]:
                     continue
 
-                for update in response["updates"]:
-                    event = self._event_wrapper(update)
-                    asyncio.create_task(self._run_through_callbacks(event))
+                events = [
+                    event_wrapper(update) for update in response["updates"]
+                ]
+                # Коллбэки на все события ответа вызываются одной задачей
+                if self._new_event_callbacks:
+                    create_background_task(
+                        self._run_through_callbacks(*events)
+                    )
+                for event in events:
                     yield event
 
     async def _resolve_faileds(self, response: dict):
@@ -185,7 +196,7 @@ class LongPollBase(SessionContainerMixin, EventsFactory):
         Обрабатывает LongPoll ошибки (faileds)
         """
         if response["failed"] == 1:
-            self._requests_query_params.update(ts=response["ts"])
+            self._requests_query_params["ts"] = response["ts"]
         elif response["failed"] in (2, 3):
             await self._setup()
         else:
@@ -12,9 +12,12 @@ class Wrapper:
     def __format__(self, format_spec: str) -> str:
         format_spec = format_spec.replace(">", "}")
         format_spec = format_spec.replace("<", "{")
+        # Поля копируются один раз, а дополнительные
+        # (если есть) перекрывают их уже в этой копии
+        inserted_values = SafeDict(self.fields)
         extra_fields = self._extra_fields_to_format()
-        format_fields = {**self.fields, **extra_fields}
-        inserted_values = SafeDict(format_fields)
+        if extra_fields:
+            inserted_values.update(extra_fields)
         return format_spec.format_map(inserted_values)
 
     @property
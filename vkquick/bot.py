@@ -7,6 +7,7 @@ import typing as ty
 from loguru import logger
 
 from vkquick.api import API
+from vkquick.background_tasks import create_background_task
 from vkquick.bases.easy_decorator import easy_method_decorator
 from vkquick.bases.event import Event
 from vkquick.bases.events_factories import EventsFactory
@@ -15,6 +16,11 @@ from vkquick.event_handler.handler import EventHandler
 from vkquick.longpoll import GroupLongPoll, UserLongPoll
 from vkquick.signal import SignalHandler
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover
+    uvloop = None
+
 if ty.TYPE_CHECKING:
     from vkquick import Filter
     from vkquick.bases.middleware import Middleware
@@ -67,6 +73,7 @@ class Bot:
         event_handlers: ty.Optional[ty.List[EventHandler]] = None,
         signals: ty.Optional[ty.Dict[str, SignalHandler]] = None,
         middlewares: ty.Optional[ty.List[Middleware]] = None,
+        use_uvloop: bool = True,
     ) -> None:
         """
         Arguments:
@@ -78,12 +85,18 @@ class Bot:
                 нового события
             signals: Возможные обработчики сигналов
             middlewares: Мидлвары, вызываемые перед и после обработки
+            use_uvloop: Использовать ли `uvloop` в качестве цикла событий
+                при запуске через `run`. Если `uvloop` не установлен
+                (например, на Windows), используется стандартный цикл.
+                После завершения `run` прежняя политика цикла событий
+                восстанавливается
         """
         self._api = api
         self._events_factory = events_factory
         self._event_handlers: ty.List[EventHandler] = event_handlers or []
         self._signals: ty.Dict[str, SignalHandler] = signals or {}
         self._middlewares: ty.List[Middleware] = middlewares or []
+        self._use_uvloop = use_uvloop
 
     @classmethod
     def via_token(cls, token: str, **kwargs) -> Bot:
@@ -148,10 +161,18 @@ class Bot:
         Returns:
 
         """
+        # Политика цикла событий меняется только на время работы бота
+        previous_policy = None
+        if self._use_uvloop and uvloop is not None:
+            previous_policy = asyncio.get_event_loop_policy()
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
         try:
             asyncio.run(self.coroutine_run())
         except KeyboardInterrupt:
             pass
+        finally:
+            if previous_policy is not None:
+                asyncio.set_event_loop_policy(previous_policy)
 
     async def coroutine_run(self) -> ty.NoReturn:
         """
@@ -181,9 +202,10 @@ class Bot:
 
         :return: Запуск вечный, этот метод не возвращает никакое значение.
         """
+        route_context = self._route_context
         async for event in self._events_factory.listen():
             epctx = EventProcessingContext(bot=self, event=event)
-            asyncio.create_task(self._route_context(epctx))
+            create_background_task(route_context(epctx))
 
     async def _setup_events_factory(self) -> None:
         """
@@ -205,9 +227,13 @@ class Bot:
 
         :param epctx: Контекст обработки события.
         """
-        await self._call_forward_middlewares(epctx)
-        await self._pass_context_through_handlers(epctx)
-        await self._call_afterword_middlewares(epctx)
+        # Без мидлваров не создаем лишние корутины на каждое событие
+        if self._middlewares:
+            await self._call_forward_middlewares(epctx)
+            await self._pass_context_through_handlers(epctx)
+            await self._call_afterword_middlewares(epctx)
+        else:
+            await self._pass_context_through_handlers(epctx)
 
     async def _pass_context_through_handlers(
         self, epctx: EventProcessingContext
@@ -219,11 +245,18 @@ class Bot:
 
         :param epctx: Контекст обработки события.
         """
-        handling_coros = [
-            handler(epctx.make_ehctx_for(handler))
-            for handler in self._event_handlers
-        ]
-        await asyncio.gather(*handling_coros)
+        # Для единственного хэндлера `gather` с его созданием задачи
+        # не нужен -- обработчик можно просто дождаться
+        if len(self._event_handlers) == 1:
+            handler = self._event_handlers[0]
+            await handler(epctx.make_ehctx_for(handler))
+        else:
+            make_ehctx_for = epctx.make_ehctx_for
+            handling_coros = [
+                handler(make_ehctx_for(handler))
+                for handler in self._event_handlers
+            ]
+            await asyncio.gather(*handling_coros)
         logger.debug("Handlers called. Context: {epctx}", epctx=epctx)
 
     async def _call_forward_middlewares(
@@ -253,7 +286,9 @@ class Bot:
         self,
         __handler: ty.Optional[ty.Callable] = None,
         *,
-        handling_event_types: ty.Set[str] = None,
+        handling_event_types: ty.Union[
+            str, ty.Iterable[ty.Union[str, int]], None
+        ] = None,
         filters: ty.List[Filter] = None,
         pass_ehctx_as_argument: bool = True,
     ) -> EventHandler:
@@ -268,12 +303,17 @@ class Bot:
         Arguments:
             __handler: Обработчик события/функция, которая
                 будет передана при создании обработчика
-            handling_event_types: Множество типов обрабатываемых событий
+            handling_event_types: Тип обрабатываемого события
+                или набор таких типов. По умолчанию — имя функции-обработчика
             filters: Фильтры обработчика событий
             pass_ehctx_as_argument: Нужно ли передавать контекст в качестве аргумента
 
         Returns:
             Объект обработчика событий
+
+        Raises:
+            TypeError: Если `handling_event_types` не является
+                ни строкой, ни итерируемым объектом
         """
         if not isinstance(__handler, EventHandler):
             __handler = EventHandler(
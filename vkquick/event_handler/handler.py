@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import collections.abc
 import inspect
 import typing as ty
 
@@ -22,6 +23,10 @@ from vkquick.exceptions import (
     StopHandlingEvent,
 )
 
+# Контейнер не содержит полей, поэтому один инстанс
+# используется для всех неподходящих событий
+_INCORRECT_EVENT_TYPE = IncorrectEventType()
+
 
 class EventHandler(EasyDecorator):
     """ """
@@ -29,14 +34,29 @@ class EventHandler(EasyDecorator):
         self,
         __handler: ty.Optional[ty.Callable[..., ty.Awaitable]] = None,
         *,
-        handling_event_types: ty.Union[ty.Set[str], ty.Type[...]] = None,
+        handling_event_types: ty.Union[
+            str, ty.Iterable[ty.Union[str, int]], None
+        ] = None,
         filters: ty.List[Filter] = None,
         pass_ehctx_as_argument: bool = True,
     ):
         self._handler = __handler
-        self._handling_event_types = handling_event_types or {
-            __handler.__name__
-        }
+        # Строка считается одним типом события, а не набором символов
+        if isinstance(handling_event_types, str):
+            handling_event_types = {handling_event_types}
+        elif not (
+            handling_event_types is None
+            or isinstance(handling_event_types, collections.abc.Iterable)
+        ):
+            raise TypeError(
+                "`handling_event_types` should be an event type name "
+                f"or an iterable of event types, got {handling_event_types!r}"
+            )
+        # `frozenset` дает проверку типа события за O(1), даже
+        # если типы были переданы списком или кортежем
+        self._handling_event_types = frozenset(
+            handling_event_types or {__handler.__name__}
+        )
         self._filters = filters or []
         self._pass_ehctx_as_argument = pass_ehctx_as_argument
         self._available_arguments_name = frozenset(
@@ -70,7 +90,7 @@ class EventHandler(EasyDecorator):
         uncovered_event_types = (
             self._handling_event_types - filter.__accepted_event_types__
         )
-        if self._handling_event_types - filter.__accepted_event_types__:
+        if uncovered_event_types:
             raise NotCompatibleFilterError(
                 filter=filter,
                 event_handler=self,
@@ -114,7 +134,7 @@ class EventHandler(EasyDecorator):
         if ehctx.epctx.event.type not in self._handling_event_types:
             raise StopHandlingEvent(
                 status=EventHandlingStatus.INCORRECT_EVENT_TYPE,
-                payload=IncorrectEventType(),
+                payload=_INCORRECT_EVENT_TYPE,
             )
 
         await self.run_through_filters(ehctx)
@@ -157,11 +177,12 @@ class EventHandler(EasyDecorator):
         Returns:
 
         """
-        passed_arguments_name = frozenset(ehctx.handler_arguments.keys())
-        if passed_arguments_name != self._available_arguments_name:
+        # `dict.keys()` сравнивается с множеством напрямую,
+        # так что промежуточный `frozenset` нужен только для ошибки
+        if ehctx.handler_arguments.keys() != self._available_arguments_name:
             raise IncorrectPreparedArgumentsError(
                 expected_names=self._available_arguments_name,
-                actual_names=passed_arguments_name,
+                actual_names=frozenset(ehctx.handler_arguments.keys()),
             )
 
     def __repr__(self):
@@ -59,7 +59,7 @@ class NotCompatibleFilterError(Exception):
         *,
         filter: Filter,
         event_handler: EventHandler,
-        uncovered_event_types: ty.Set[ty.Union[int, str]],
+        uncovered_event_types: ty.AbstractSet[ty.Union[int, str]],
     ):
         self.filter = filter
         self.event_handler = event_handler
@@ -141,24 +141,26 @@ class VKAPIError(Exception):
             item["key"]: item["value"] for item in request_params
         }
 
-        pretty_exception_text = (
-            huepy.red(f"\n[{status_code}]")
-            + f" {description}\n\n"
-            + huepy.grey("Request params:")
-        )
+        # Части текста собираются в список и склеиваются один раз,
+        # чтобы не пересоздавать строку на каждый параметр
+        text_parts = [
+            huepy.red(f"\n[{status_code}]"),
+            f" {description}\n\n",
+            huepy.grey("Request params:"),
+        ]
 
         for key, value in request_params.items():
             key = huepy.yellow(key)
             value = huepy.cyan(value)
-            pretty_exception_text += f"\n{key} = {value}"
+            text_parts.append(f"\n{key} = {value}")
 
         # Если остались дополнительные поля
         if response["error"]:
-            pretty_exception_text += (
-                "\n\n"
-                + huepy.info("There are some extra fields:\n")
-                + str(response["error"])
-            )
+            text_parts.append("\n\n")
+            text_parts.append(huepy.info("There are some extra fields:\n"))
+            text_parts.append(str(response["error"]))
+
+        pretty_exception_text = "".join(text_parts)
 
         return cls(
             pretty_exception_text=pretty_exception_text,
@@ -44,9 +44,11 @@ class GroupLongPoll(LongPollBase):
             group_id=self._group_id
         )
         self._server_url = new_lp_settings.pop("server")
-        self._requests_query_params = dict(
-            act="a_check", wait=self._wait, **new_lp_settings
-        )
+        self._requests_query_params = {
+            "act": "a_check",
+            "wait": self._wait,
+            **new_lp_settings,
+        }
 
     async def _define_group_id(self):
         if self._group_id is None:
@@ -89,10 +91,10 @@ class UserLongPoll(LongPollBase):
         )
         server_url = new_lp_settings.pop("server")
         self._server_url = f"https://{server_url}"
-        self._requests_query_params = dict(
-            act="a_check",
-            wait=self._wait,
-            mode=self._mode,
-            version=self._version,
+        self._requests_query_params = {
+            "act": "a_check",
+            "wait": self._wait,
+            "mode": self._mode,
+            "version": self._version,
             **new_lp_settings,
-        )
+        }
@@ -3,6 +3,9 @@ import json
 import pygments.formatters
 import pygments.lexers
 
+_JSON_LEXER = pygments.lexers.JsonLexer()
+_TERMINAL_FORMATTER = pygments.formatters.TerminalFormatter(bg="light")
+
 
 def pretty_view(__mapping: dict) -> str:
     """
@@ -15,8 +18,6 @@ def pretty_view(__mapping: dict) -> str:
     """
     dumped_mapping = json.dumps(__mapping, ensure_ascii=False, indent=4)
     pretty_mapping = pygments.highlight(
-        dumped_mapping,
-        pygments.lexers.JsonLexer(),
-        pygments.formatters.TerminalFormatter(bg="light"),
+        dumped_mapping, _JSON_LEXER, _TERMINAL_FORMATTER
     )
     return pretty_mapping